@@ -1,22 +1,35 @@
+import matplotlib
+
+# Render without a GUI backend; the chart is only saved to disk
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
-import pandas as pd
 
-# Mock SQL query result
-data = [('Italian', 25), ('American', 22), ('Indian', 20), ('Mexican', 19), ('Chinese', 14)]
 
-# Convert data to a pandas dataframe
-df = pd.DataFrame(data, columns=['cuisine_type', 'count']).set_index('cuisine_type')
+def render_bar_chart(labels, counts, path, xlabel, ylabel, title):
+    """Draw a bar chart and save it as a PNG file."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.bar(labels, counts, color='skyblue')
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True)
+    fig.savefig(path)
+    plt.close(fig)  # Free the figure once it is on disk
 
-# Create the plot
-plt.figure(figsize=(8, 6))
-plt.bar(df.index, df['count'], color='skyblue')
-plt.xlabel('Cuisine Type')
-plt.ylabel('Count')
-plt.title('Top 5 Cuisine Types by Count')
-plt.grid(True)
 
-# Save the plot as a PNG file
-plt.savefig('top_5_cuisine_types.png')
+# Mock SQL query result
+data = [('Italian', 25), ('American', 22), ('Indian', 20), ('Mexican', 19), ('Chinese', 14)]
+
+# Split the rows into bar labels and heights
+labels, counts = zip(*data)
 
-# Show the plot
-plt.show()
\ No newline at end of file
+# Create the plot and save it as a PNG file
+render_bar_chart(
+    labels,
+    counts,
+    'top_5_cuisine_types.png',
+    xlabel='Cuisine Type',
+    ylabel='Count',
+    title='Top 5 Cuisine Types by Count',
+)